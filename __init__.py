@@ -7,45 +7,48 @@ This package provides tools for:
 - Tracking board evolution over time
 """
 
-# Lazy imports to avoid RuntimeWarning when running modules directly
+import importlib
+import sys
+
+# Lazy imports to avoid RuntimeWarning when running modules directly.
+# Maps attribute name -> submodule that provides it.
+_LAZY_ATTRS = {
+    'FigmaTracker': 'tracker',
+    'capture_figma_snapshot': 'tracker',
+    'capture_figma_snapshots': 'tracker',
+    'capture_figma_snapshot_async': 'tracker',
+    'FigmaSnapshot': 'tracker',
+    'FigmaNode': 'tracker',
+    'ChangeReport': 'tracker',
+    'NodeChange': 'tracker',
+    'show_status': 'capture',
+    'print_capture_prompt': 'capture',
+    'figma_config': 'config',
+    'config': 'config',
+}
+
+
 def __getattr__(name):
-    """Lazy load modules to avoid import issues."""
-    if name == 'FigmaTracker':
-        from .tracker import FigmaTracker
-        return FigmaTracker
-    elif name == 'capture_figma_snapshot':
-        from .tracker import capture_figma_snapshot
-        return capture_figma_snapshot
-    elif name == 'FigmaSnapshot':
-        from .tracker import FigmaSnapshot
-        return FigmaSnapshot
-    elif name == 'FigmaNode':
-        from .tracker import FigmaNode
-        return FigmaNode
-    elif name == 'ChangeReport':
-        from .tracker import ChangeReport
-        return ChangeReport
-    elif name == 'NodeChange':
-        from .tracker import NodeChange
-        return NodeChange
-    elif name == 'show_status':
-        from .capture import show_status
-        return show_status
-    elif name == 'print_capture_prompt':
-        from .capture import print_capture_prompt
-        return print_capture_prompt
-    elif name == 'figma_config':
-        from .config import figma_config
-        return figma_config
-    elif name == 'config':
-        from .config import config
-        return config
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    """Lazy load modules to avoid import issues (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', __name__)
+    # The submodule import dominates the cost, so bind every lazy
+    # attribute it provides in one pass; later lookups (for any of
+    # them) skip __getattr__ entirely.
+    package = sys.modules[__name__]
+    for attr, provider in _LAZY_ATTRS.items():
+        if provider == module_name:
+            setattr(package, attr, getattr(module, attr))
+    return getattr(package, name)
 
 
 __all__ = [
     'FigmaTracker',
     'capture_figma_snapshot',
+    'capture_figma_snapshots',
+    'capture_figma_snapshot_async',
     'FigmaSnapshot',
     'FigmaNode',
     'ChangeReport',
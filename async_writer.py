@@ -0,0 +1,109 @@
+"""
+Background snapshot persistence.
+
+Saving a snapshot synchronously puts JSON encoding and disk I/O on the
+caller's critical path, even though the caller usually only needs the
+parsed FigmaSnapshot to continue (e.g. to fire the next MCP fetch).
+AsyncSnapshotWriter moves save_snapshot calls onto a single daemon
+thread: submit() enqueues the work and returns a Future immediately,
+and the write overlaps whatever the caller does next.
+
+A single worker is deliberate, not a limitation: snapshots for a board
+form a delta chain, so saves must land in submission order. One thread
+draining a FIFO queue guarantees that; a pool would not.
+
+Writes are flushed at interpreter exit via atexit, so queued snapshots
+are not lost when a script using the async path simply returns.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .tracker import FigmaSnapshot, FigmaTracker
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSnapshotWriter:
+    """
+    Single-threaded background writer for snapshot persistence.
+
+    Usage:
+        writer = get_writer()
+        future = writer.submit(tracker, snapshot)
+        ...  # parse / fetch the next board while the write happens
+        filepath = future.result()  # block only when the path is needed
+    """
+
+    def __init__(self, maxsize: int = 256):
+        # A bounded queue applies backpressure if producers outrun the
+        # disk instead of buffering snapshots without limit.
+        self._queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        tracker: "FigmaTracker",
+        snapshot: "FigmaSnapshot",
+    ) -> "Future[Path]":
+        """
+        Queue a snapshot for saving; returns a Future for the path.
+
+        Saves are performed in submission order by one worker thread,
+        which keeps each board's delta chain consistent.
+        """
+        self._ensure_thread()
+        future: "Future[Path]" = Future()
+        self._queue.put((tracker, snapshot, future))
+        return future
+
+    def flush(self) -> None:
+        """Block until every queued snapshot has been written."""
+        self._queue.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._drain,
+                    name="figma-snapshot-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            tracker, snapshot, future = self._queue.get()
+            try:
+                future.set_result(tracker.save_snapshot(snapshot))
+            except BaseException as e:  # surfaced via the Future
+                logger.error(f"Background snapshot save failed: {e}")
+                future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+
+# Shared writer instance, created on first use so importing this module
+# never starts a thread.
+_writer: Optional[AsyncSnapshotWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> AsyncSnapshotWriter:
+    """Return the process-wide AsyncSnapshotWriter, creating it lazily."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AsyncSnapshotWriter()
+                atexit.register(_writer.flush)
+    return _writer
@@ -17,20 +17,36 @@ WORKFLOW:
     4. AI captures the snapshot and shows comparison
 """
 
-import argparse
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from .config import config
-from .tracker import FigmaTracker
 
+if TYPE_CHECKING:
+    from .tracker import FigmaTracker
 
-def get_time_ago(timestamp_str: str) -> str:
-    """Convert a timestamp string to a human-readable 'time ago' format."""
+
+def get_time_ago(timestamp_str: str, now: datetime = None) -> str:
+    """
+    Convert a timestamp string to a human-readable 'time ago' format.
+
+    Args:
+        timestamp_str: Timestamp like "2025-12-17_221011".
+        now: Reference time. Callers formatting many timestamps can pass
+            a single datetime.now() instead of paying one clock read each.
+    """
     try:
-        # Parse timestamp like "2025-12-17_221011"
-        dt = datetime.strptime(timestamp_str, "%Y-%m-%d_%H%M%S")
-        now = datetime.now()
+        # Parse the timestamp by slicing directly; the format is fixed,
+        # so strptime's format machinery is overkill.
+        s = timestamp_str
+        dt = datetime(
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[13:15]), int(s[15:17])
+        )
+        if now is None:
+            now = datetime.now()
         diff = now - dt
         
         if diff.days > 0:
@@ -45,58 +61,100 @@ def get_time_ago(timestamp_str: str) -> str:
             return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
         
         return "just now"
-    except:
+    except (ValueError, IndexError):
         return "unknown"
 
 
-def show_status(tracker: FigmaTracker) -> dict:
+@dataclass(slots=True)
+class StatusInfo:
+    """
+    Snapshot status for a board.
+
+    Slotted to keep the per-call footprint down; supports mapping-style
+    access ([] and get) so existing dict-shaped callers keep working.
+    """
+    board_name: str
+    board_display_name: str
+    total_snapshots: int
+    snapshot_dir: str
+    last_snapshot: Optional[str] = None
+    last_snapshot_ago: Optional[str] = None
+    last_node_count: Optional[int] = None
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        """Dict-style get; unset (None) fields fall back to the default."""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+
+def show_status(tracker: "FigmaTracker") -> StatusInfo:
     """Display current snapshot status and return status info."""
     snapshots = tracker.list_snapshots()
     board_config = tracker.board_config
-    
-    status = {
-        "board_name": tracker.board_name,
-        "board_display_name": board_config.get("name", tracker.board_name),
-        "total_snapshots": len(snapshots),
-        "last_snapshot": None,
-        "last_snapshot_ago": None,
-        "snapshot_dir": str(tracker.snapshot_dir)
-    }
-    
+
+    status = StatusInfo(
+        board_name=tracker.board_name,
+        board_display_name=board_config.get("name", tracker.board_name),
+        total_snapshots=len(snapshots),
+        snapshot_dir=str(tracker.snapshot_dir),
+    )
+
     if snapshots:
         latest = snapshots[0]
-        status["last_snapshot"] = latest["timestamp"]
-        status["last_snapshot_ago"] = get_time_ago(latest["timestamp"])
-        status["last_node_count"] = latest.get("node_count", 0)
-    
+        status.last_snapshot = latest["timestamp"]
+        status.last_snapshot_ago = get_time_ago(latest["timestamp"])
+        status.last_node_count = latest.get("node_count", 0)
+
     return status
 
 
+# Bars and the prompt layout are fixed; render them once at import time
+# so each call is a single format + write instead of ~15 prints.
+_BAR = "=" * 60
+_SUBBAR = "-" * 60
+
+_CAPTURE_PROMPT_TEMPLATE = f"""
+{_BAR}
+Figma Snapshot Status: {{board_display_name}}
+{_BAR}
+{{last_block}}
+  Total snapshots: {{total_snapshots}}
+  Storage: {{snapshot_dir}}
+
+{_SUBBAR}
+To capture a new snapshot, paste this in Cursor chat:
+{_SUBBAR}
+
+  capture figma snapshot and compare
+
+{_SUBBAR}
+{_BAR}
+
+"""
+
+
 def print_capture_prompt(status: dict) -> None:
     """Print the status and capture prompt."""
-    print()
-    print("=" * 60)
-    print(f"Figma Snapshot Status: {status['board_display_name']}")
-    print("=" * 60)
-    
     if status["last_snapshot"]:
-        print(f"  Last snapshot: {status['last_snapshot']} ({status['last_snapshot_ago']})")
-        print(f"  Nodes captured: {status.get('last_node_count', 'N/A')}")
+        last_block = (
+            f"  Last snapshot: {status['last_snapshot']} ({status['last_snapshot_ago']})\n"
+            f"  Nodes captured: {status.get('last_node_count', 'N/A')}"
+        )
     else:
-        print("  No snapshots yet - this will be the first!")
-    
-    print(f"  Total snapshots: {status['total_snapshots']}")
-    print(f"  Storage: {status['snapshot_dir']}")
-    print()
-    print("-" * 60)
-    print("To capture a new snapshot, paste this in Cursor chat:")
-    print("-" * 60)
-    print()
-    print("  capture figma snapshot and compare")
-    print()
-    print("-" * 60)
-    print("=" * 60)
-    print()
+        last_block = "  No snapshots yet - this will be the first!"
+
+    sys.stdout.write(_CAPTURE_PROMPT_TEMPLATE.format(
+        board_display_name=status["board_display_name"],
+        last_block=last_block,
+        total_snapshots=status["total_snapshots"],
+        snapshot_dir=status["snapshot_dir"],
+    ))
 
 
 def print_status_only(status: dict) -> None:
@@ -118,8 +176,37 @@ def print_status_only(status: dict) -> None:
     print()
 
 
+def _parse_args_fast(argv):
+    """
+    Recognize the fixed fast-path invocations without importing argparse.
+
+    Returns a (board, status_only, list_boards) tuple, or None if the
+    arguments need the full argparse treatment.
+    """
+    if not argv:
+        return (None, False, False)
+    if argv == ["--status"] or argv == ["-s"]:
+        return (None, True, False)
+    if argv == ["--list-boards"]:
+        return (None, False, True)
+    return None
+
+
 def main():
     """Main entry point."""
+    fast = _parse_args_fast(sys.argv[1:])
+    if fast is not None:
+        board, status_only, list_boards = fast
+    else:
+        board, status_only, list_boards = _parse_args_full()
+
+    run(board, status_only, list_boards)
+
+
+def _parse_args_full():
+    """Parse arguments with argparse (imported lazily; ~15ms cold)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Figma Snapshot Capture Trigger",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -154,9 +241,13 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+    return args.board, args.status, args.list_boards
+
+
+def run(board: str = None, status_only: bool = False, list_boards: bool = False) -> None:
+    """Execute the capture CLI with already-parsed options."""
     # List boards
-    if args.list_boards:
+    if list_boards:
         print("\nConfigured Figma Boards:")
         print("-" * 40)
         for name, info in config.FIGMA_BOARDS.items():
@@ -165,19 +256,22 @@ Examples:
         print()
         return
     
-    # Initialize tracker
+    # Initialize tracker. Imported here so the --list-boards path never
+    # pays for the tracker module (json, re, parser registry, ...).
+    from .tracker import FigmaTracker
+
     try:
-        tracker = FigmaTracker(args.board)
+        tracker = FigmaTracker(board)
     except ValueError as e:
         print(f"\nError: {e}")
         print(f"Available boards: {', '.join(config.FIGMA_BOARDS.keys())}")
         return
-    
+
     # Get status
     status = show_status(tracker)
-    
+
     # Print output
-    if args.status:
+    if status_only:
         print_status_only(status)
     else:
         print_capture_prompt(status)
@@ -16,12 +16,17 @@ EXAMPLE PROMPTS FOR AI:
 - "Download a screenshot of the FigJam board"
 """
 
+import bisect
+import heapq
 import os
-import shutil
+import re
+import sys
+import time
 import logging
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 from .config import config, FigmaConfig
 
@@ -36,55 +41,175 @@ logger = logging.getLogger(__name__)
 # Default board to capture
 DEFAULT_BOARD = config.DEFAULT_FIGMA_BOARD
 
+# Leading YYYY-MM-DD_HHMMSS timestamp in snapshot filenames. Zero-padded ISO
+# order means these prefixes sort chronologically as plain strings.
+_TS_PREFIX_RE = re.compile(r'\d{4}-\d{2}-\d{2}_\d{6}$')
+_TS_PREFIX_LEN = 17
+_TS_KEY_FORMAT = '%Y-%m-%d_%H%M%S'
+
+# Row layout for list_snapshots; the %-operator path is C-implemented
+# and avoids re-dispatching f-string pieces per row.
+_SNAPSHOT_ROW_FMT = '  %s | %8.1f KB | %s'
+
+# Below this many pending stats, a thread pool costs more than it saves
+_PARALLEL_STAT_MIN_ENTRIES = 256
+
+
+def _timestamp_key_to_datetime(key: str) -> datetime:
+    """Convert a YYYY-MM-DD_HHMMSS sort key back to a datetime."""
+    return datetime(
+        int(key[0:4]), int(key[5:7]), int(key[8:10]),
+        int(key[11:13]), int(key[13:15]), int(key[15:17])
+    )
+
+
+# Directories already created during this process; mkdir with
+# exist_ok=True still costs a syscall, so only pay it once per path.
+_created_dirs = set()
+
 
 def get_figma_snapshots_dir() -> Path:
     """
     Get the directory for storing Figma snapshots.
-    
+
     Returns:
         Path to the Figma snapshots directory.
     """
     figma_dir = config.RAW_DATA_DIR / "figma"
-    figma_dir.mkdir(parents=True, exist_ok=True)
+    if figma_dir not in _created_dirs:
+        figma_dir.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(figma_dir)
     return figma_dir
 
 
+def _scan_snapshot_keys(
+    board_name: str = None,
+    max_age_days: int = 30,
+    limit: int = None
+) -> List[Tuple[str, Path]]:
+    """
+    Scan the snapshots directory and return (sort_key, file_path) tuples,
+    newest first.
+
+    The sort key is the filename's YYYY-MM-DD_HHMMSS prefix (or an
+    equivalent string derived from mtime); no datetime objects are
+    built here, so callers that only need paths pay nothing extra.
+    """
+    figma_dir = get_figma_snapshots_dir()
+
+    if not figma_dir.exists():
+        return []
+
+    if max_age_days is None:
+        cutoff_ns = cutoff_key = None
+    else:
+        # Integer nanosecond cutoff: matches st_mtime_ns exactly, so the
+        # age check is an int compare with no float rounding at the edge.
+        cutoff_ns = time.time_ns() - max_age_days * 86_400_000_000_000
+        cutoff_key = datetime.fromtimestamp(cutoff_ns / 1e9).strftime(_TS_KEY_FORMAT)
+
+    # The naming scheme puts the board name last, so board filtering
+    # collapses into a single precomputed endswith check.
+    name_suffix = f"_{board_name}.png" if board_name else ".png"
+
+    # Pattern: YYYY-MM-DD_HHMMSS_board-name.png
+    # scandir() caches stat info from the directory read, so the cheap
+    # name checks run before any extra syscall is needed.
+    matched = []
+
+    def consider(entry: os.DirEntry) -> None:
+        if not entry.name.endswith(name_suffix):
+            return
+        if not entry.is_file():
+            return
+        # Prefer the timestamp already encoded in the filename so no
+        # stat is needed for ordering; fall back to mtime otherwise.
+        prefix = entry.name[:_TS_PREFIX_LEN]
+        if _TS_PREFIX_RE.match(prefix):
+            key = prefix
+        else:
+            key = datetime.fromtimestamp(
+                entry.stat().st_mtime
+            ).strftime(_TS_KEY_FORMAT + '.%f')
+        matched.append((key, entry))
+
+    board_dirs = []
+    with os.scandir(figma_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Board-sharded layout: descend only into the requested
+                # board's directory (or all of them when unfiltered).
+                if board_name is None or entry.name == board_name:
+                    board_dirs.append(entry.path)
+                continue
+            consider(entry)
+
+    for board_dir in board_dirs:
+        with os.scandir(board_dir) as entries:
+            for entry in entries:
+                consider(entry)
+
+    # Sort by key once and binary-search the age cutoff instead of
+    # comparing every key against it. Without an age filter there is
+    # nothing to cut, so every match passes straight through.
+    matched.sort(key=itemgetter(0))
+    if cutoff_key is None:
+        start = 0
+    else:
+        keys = [item[0] for item in matched]
+        start = bisect.bisect_left(keys, cutoff_key)
+
+    found_files = [(key, Path(entry.path)) for key, entry in matched[start:]]
+
+    # Entries whose name-key predates the cutoff may still qualify: the
+    # cutoff is defined on modification time, so double-check mtime
+    # before dropping them.
+    stale = matched[:start]
+    if stale:
+        if config.PARALLEL_STAT and len(stale) > _PARALLEL_STAT_MIN_ENTRIES:
+            # On network filesystems each stat pays a round trip;
+            # overlap them instead of paying O(N * RTT) serially.
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=32) as pool:
+                mtimes = list(pool.map(lambda item: item[1].stat().st_mtime_ns, stale))
+        else:
+            mtimes = [entry.stat().st_mtime_ns for _, entry in stale]
+        for (key, entry), mtime_ns in zip(stale, mtimes):
+            if mtime_ns >= cutoff_ns:
+                found_files.append((key, Path(entry.path)))
+
+    if limit is not None:
+        # O(n) selection of the newest few instead of a full sort
+        return heapq.nlargest(limit, found_files)
+
+    # Sort by timestamp key (newest first)
+    found_files.sort(reverse=True)
+    return found_files
+
+
 def find_figma_snapshots(
     board_name: str = None,
-    max_age_days: int = 30
+    max_age_days: int = 30,
+    limit: int = None
 ) -> List[Tuple[Path, datetime]]:
     """
     Find existing Figma board snapshots.
-    
+
     Args:
         board_name: Filter by board name (e.g., 'decision-tree'). None for all.
         max_age_days: Maximum age of snapshots to include (in days).
-        
+            None disables the age filter entirely; timestamp-named files
+            are then ordered purely by filename, with no stat calls.
+        limit: Return at most this many snapshots (newest first). None for all.
+
     Returns:
         List of tuples (file_path, modification_time) sorted by newest first.
     """
-    figma_dir = get_figma_snapshots_dir()
-    
-    if not figma_dir.exists():
-        return []
-    
-    cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
-    found_files = []
-    
-    # Pattern: YYYY-MM-DD_HHMMSS_board-name.png
-    for file_path in figma_dir.glob("*.png"):
-        if file_path.is_file():
-            mtime = file_path.stat().st_mtime
-            if mtime >= cutoff_time:
-                # Filter by board name if specified
-                if board_name and board_name not in file_path.name:
-                    continue
-                found_files.append((file_path, datetime.fromtimestamp(mtime)))
-    
-    # Sort by modification time (newest first)
-    found_files.sort(key=lambda x: x[1], reverse=True)
-    
-    return found_files
+    # Build datetime objects only for the entries actually returned
+    return [
+        (path, _timestamp_key_to_datetime(key))
+        for key, path in _scan_snapshot_keys(board_name, max_age_days, limit)
+    ]
 
 
 def get_snapshot_filename(board_name: str = DEFAULT_BOARD) -> str:
@@ -101,6 +226,34 @@ def get_snapshot_filename(board_name: str = DEFAULT_BOARD) -> str:
     return f"{timestamp}_{board_name}.png"
 
 
+def _copy_snapshot_file(source_path: Path, target_path: Path) -> None:
+    """
+    Copy a snapshot file, preserving metadata.
+
+    Uses os.copy_file_range when the platform offers it (Linux 4.5+),
+    which copies in-kernel and clones instead of copying bytes on
+    CoW filesystems like btrfs/xfs. Falls back to shutil.copy2.
+    """
+    import shutil
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(str(source_path), str(target_path))
+            return
+        except OSError:
+            # Cross-device links, unsupported filesystems, etc. —
+            # fall through to the portable userspace copy.
+            pass
+    shutil.copy2(str(source_path), str(target_path))
+
+
 def save_snapshot(
     source_path: Path,
     board_name: str = DEFAULT_BOARD,
@@ -123,10 +276,16 @@ def save_snapshot(
     
     try:
         if keep_source:
-            shutil.copy2(str(source_path), str(target_path))
+            _copy_snapshot_file(source_path, target_path)
             logger.info(f"Copied snapshot to {target_path}")
         else:
-            shutil.move(str(source_path), str(target_path))
+            try:
+                # Same-filesystem move: a single atomic rename, no bytes copied
+                os.rename(source_path, target_path)
+            except OSError:
+                # Cross-device (EXDEV etc.): fall back to copy + unlink
+                import shutil
+                shutil.move(str(source_path), str(target_path))
             logger.info(f"Moved snapshot to {target_path}")
         return target_path
     except Exception as e:
@@ -143,25 +302,50 @@ def list_snapshots(board_name: str = None, max_age_days: int = 30) -> None:
         max_age_days: Maximum age of snapshots to show (in days).
     """
     found_files = find_figma_snapshots(board_name, max_age_days)
-    
+
     if not found_files:
-        print(f"\nNo snapshots found (last {max_age_days} days)")
+        lines = [f"\nNo snapshots found (last {max_age_days} days)"]
         if board_name:
-            print(f"  Board filter: {board_name}")
+            lines.append(f"  Board filter: {board_name}")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
-    
-    print(f"\n{'='*70}")
-    print(f"Figma Board Snapshots in {get_figma_snapshots_dir()}")
+
+    # Build the whole listing in memory and emit it with a single write
+    # instead of one locked print per row.
+    lines = [f"\n{'='*70}",
+             f"Figma Board Snapshots in {get_figma_snapshots_dir()}"]
     if board_name:
-        print(f"  Filtered by: {board_name}")
-    print(f"{'='*70}")
-    
+        lines.append(f"  Filtered by: {board_name}")
+    lines.append(f"{'='*70}")
+
     for file_path, mod_time in found_files:
-        size_kb = file_path.stat().st_size / 1024
-        print(f"  {mod_time.strftime('%Y-%m-%d %H:%M')} | {size_kb:>8.1f} KB | {file_path.name}")
-    
-    print(f"{'='*70}")
-    print(f"Total: {len(found_files)} snapshots")
+        size_kb = os.stat(file_path).st_size / 1024
+        lines.append(_SNAPSHOT_ROW_FMT % (
+            mod_time.strftime('%Y-%m-%d %H:%M'), size_kb, file_path.name))
+
+    lines.append(f"{'='*70}")
+    lines.append(f"Total: {len(found_files)} snapshots")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _file_digest(path: Path) -> bytes:
+    """Return the SHA-256 digest of a file's contents."""
+    # Imported here: only compare_snapshots hashes, and most CLI
+    # invocations never reach it.
+    import hashlib
+    import mmap
+
+    with open(path, 'rb') as f:
+        try:
+            # Hash straight out of the page cache: no intermediate
+            # bytes object and no user-space copy of the file.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).digest()
+        except (ValueError, OSError):
+            # Empty or unmappable files: stream through the hasher
+            return hashlib.file_digest(f, 'sha256').digest()
 
 
 def compare_snapshots(
@@ -170,15 +354,15 @@ def compare_snapshots(
     board_name: str = DEFAULT_BOARD
 ) -> dict:
     """
-    Compare two snapshots by file size (basic change detection).
-    
+    Compare two snapshots by size and content hash (basic change detection).
+
     If no snapshots are provided, compares the two most recent ones.
-    
+
     Args:
         snapshot1: Path to first snapshot (older).
         snapshot2: Path to second snapshot (newer).
         board_name: Board name to filter when auto-selecting snapshots.
-        
+
     Returns:
         Dictionary with comparison results:
         - 'snapshot1': Path to first snapshot
@@ -187,27 +371,44 @@ def compare_snapshots(
         - 'size2': Size of second snapshot in bytes
         - 'size_diff': Size difference in bytes
         - 'size_diff_percent': Size difference as percentage
-        - 'likely_changed': Boolean indicating if significant change detected
+        - 'likely_changed': Boolean indicating if the content changed
     """
-    # If no snapshots provided, get the two most recent
+    # If no snapshots provided, get the two most recent. Only the paths
+    # are needed, so scan the raw keys and skip datetime construction.
     if snapshot1 is None or snapshot2 is None:
-        recent = find_figma_snapshots(board_name)
+        recent = _scan_snapshot_keys(board_name, limit=2)
         if len(recent) < 2:
             return {
                 'error': 'Not enough snapshots to compare',
                 'snapshots_found': len(recent)
             }
-        snapshot2 = recent[0][0]  # newest
-        snapshot1 = recent[1][0]  # second newest
-    
-    size1 = snapshot1.stat().st_size
-    size2 = snapshot2.stat().st_size
-    size_diff = size2 - size1
-    size_diff_percent = (size_diff / size1 * 100) if size1 > 0 else 0
-    
-    # Consider >5% size change as significant
-    likely_changed = abs(size_diff_percent) > 5
+        snapshot2 = recent[0][1]  # newest
+        snapshot1 = recent[1][1]  # second newest
     
+    stat1 = os.stat(snapshot1)
+    stat2 = os.stat(snapshot2)
+    size1 = stat1.st_size
+    size2 = stat2.st_size
+
+    if size1 == size2:
+        size_diff = 0
+        size_diff_percent = 0
+        if stat1.st_mtime_ns == stat2.st_mtime_ns:
+            # Same size and same nanosecond mtime: rsync-style quick
+            # check — treat as identical without reading either file.
+            likely_changed = False
+        else:
+            # Equal sizes say little for screenshots (one edited node can
+            # preserve the byte count), so compare content hashes. SHA-256
+            # runs through OpenSSL, hardware-accelerated on modern CPUs.
+            likely_changed = _file_digest(snapshot1) != _file_digest(snapshot2)
+    else:
+        size_diff = size2 - size1
+        size_diff_percent = (size_diff / size1 * 100) if size1 > 0 else 0
+
+        # Different byte counts cannot be identical content
+        likely_changed = True
+
     return {
         'snapshot1': snapshot1,
         'snapshot2': snapshot2,
@@ -219,18 +420,33 @@ def compare_snapshots(
     }
 
 
+# Flat board-name -> URL cache, rebuilt whenever the underlying
+# FIGMA_BOARDS mapping is swapped out (e.g. config reload, tests).
+_board_urls: Dict[str, str] = {}
+_board_urls_source = None
+
+
+def _board_url_map() -> Dict[str, str]:
+    """Return the flattened board URL cache, refreshing it if stale."""
+    global _board_urls, _board_urls_source
+    boards = config.FIGMA_BOARDS
+    if boards is not _board_urls_source:
+        _board_urls = {name: info.get('url') for name, info in boards.items()}
+        _board_urls_source = boards
+    return _board_urls
+
+
 def get_board_url(board_name: str = DEFAULT_BOARD) -> Optional[str]:
     """
     Get the URL for a registered Figma board.
-    
+
     Args:
         board_name: Name of the board.
-        
+
     Returns:
         URL string, or None if board not found.
     """
-    board = config.FIGMA_BOARDS.get(board_name)
-    return board['url'] if board else None
+    return _board_url_map().get(board_name)
 
 
 def list_boards() -> None:
@@ -0,0 +1,172 @@
+"""
+Unit tests for figma_tracker.async_writer module.
+
+Tests cover:
+- Submit/flush round-trip through the background thread
+- In-order persistence of multiple submissions (delta chain intact)
+- Failure propagation through the returned Future
+- The shared writer singleton
+- The capture_figma_snapshot_async helper
+"""
+
+import pytest
+from unittest.mock import patch
+
+from figma_tracker.async_writer import AsyncSnapshotWriter, get_writer
+from figma_tracker.tracker import (
+    FigmaTracker,
+    capture_figma_snapshot_async,
+    _get_tracker,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+@pytest.fixture
+def mock_board_config():
+    """Mock board configuration."""
+    return {
+        "name": "Test Board",
+        "file_key": "test_file_key",
+        "node_id": "test_node_id",
+        "url": "https://figma.com/board/test",
+    }
+
+
+@pytest.fixture
+def temp_snapshot_dir(tmp_path):
+    """Create a temporary snapshot directory."""
+    snapshot_dir = tmp_path / "snapshots" / "test-board"
+    snapshot_dir.mkdir(parents=True)
+    return snapshot_dir
+
+
+@pytest.fixture
+def mock_config(mock_board_config, temp_snapshot_dir):
+    """Create a mock config for testing."""
+    with patch('figma_tracker.tracker.config') as mock:
+        mock.DEFAULT_FIGMA_BOARD = "test-board"
+        mock.get_figma_board_config.return_value = mock_board_config
+        mock.get_figma_board_dir.return_value = temp_snapshot_dir
+        # The helper's tracker cache would otherwise hand back an
+        # instance bound to a previous test's tmp directory.
+        _get_tracker.cache_clear()
+        yield mock
+        _get_tracker.cache_clear()
+
+
+class _FailingTracker:
+    """Stand-in tracker whose save always fails."""
+
+    def save_snapshot(self, snapshot):
+        raise OSError("disk full")
+
+
+# =============================================================================
+# AsyncSnapshotWriter Tests
+# =============================================================================
+
+class TestAsyncSnapshotWriter:
+    """Tests for the background snapshot writer."""
+
+    def test_submit_and_flush_round_trip(self, mock_config, temp_snapshot_dir):
+        """A submitted snapshot is on disk and loadable after flush."""
+        tracker = FigmaTracker("test-board")
+        snapshot = tracker.parse_figjam_response('<sticky id="s1">hello</sticky>')
+        snapshot.timestamp = "2025-01-01_000000"
+
+        writer = AsyncSnapshotWriter()
+        future = writer.submit(tracker, snapshot)
+        writer.flush()
+
+        filepath = future.result(timeout=5)
+        assert filepath.exists()
+        loaded = tracker.load_snapshot(snapshot.timestamp)
+        assert loaded is not None
+        assert loaded.nodes == snapshot.nodes
+
+    def test_multiple_submissions_persist_in_order(self, mock_config, temp_snapshot_dir):
+        """Queued saves land in submission order, keeping the delta chain."""
+        tracker = FigmaTracker("test-board")
+        writer = AsyncSnapshotWriter()
+
+        snapshots, futures = [], []
+        for i in range(3):
+            snapshot = tracker.parse_figjam_response(
+                "".join(f'<sticky id="s{j}">note {j}</sticky>' for j in range(i + 1))
+            )
+            snapshot.timestamp = f"2025-01-01_00000{i}"
+            snapshots.append(snapshot)
+            futures.append(writer.submit(tracker, snapshot))
+        writer.flush()
+
+        # First save is the full checkpoint, later ones deltas against it.
+        names = [f.result(timeout=5).name for f in futures]
+        assert names == [
+            "2025-01-01_000000.json",
+            "2025-01-01_000001.delta.json",
+            "2025-01-01_000002.delta.json",
+        ]
+        for snapshot in snapshots:
+            loaded = tracker.load_snapshot(snapshot.timestamp)
+            assert loaded is not None
+            assert sorted(loaded.nodes, key=lambda n: n.id) == \
+                sorted(snapshot.nodes, key=lambda n: n.id)
+
+    def test_failure_propagates_through_future(self, mock_config):
+        """A failed save surfaces as the Future's exception."""
+        writer = AsyncSnapshotWriter()
+
+        future = writer.submit(_FailingTracker(), None)
+        writer.flush()
+
+        with pytest.raises(OSError, match="disk full"):
+            future.result(timeout=5)
+
+    def test_writer_survives_a_failed_save(self, mock_config, temp_snapshot_dir):
+        """One failing item does not take the worker thread down."""
+        tracker = FigmaTracker("test-board")
+        writer = AsyncSnapshotWriter()
+
+        failed = writer.submit(_FailingTracker(), None)
+        snapshot = tracker.parse_figjam_response('<sticky id="s1">ok</sticky>')
+        snapshot.timestamp = "2025-01-01_000000"
+        succeeded = writer.submit(tracker, snapshot)
+        writer.flush()
+
+        assert failed.exception(timeout=5) is not None
+        assert succeeded.result(timeout=5).exists()
+
+    def test_get_writer_is_shared(self):
+        """get_writer returns one process-wide instance."""
+        assert get_writer() is get_writer()
+
+
+# =============================================================================
+# capture_figma_snapshot_async Tests
+# =============================================================================
+
+class TestCaptureFigmaSnapshotAsync:
+    """Tests for the async capture helper."""
+
+    def test_returns_snapshot_and_future_path(self, mock_config, temp_snapshot_dir):
+        """The helper parses synchronously and persists in the background."""
+        future, snapshot = capture_figma_snapshot_async(
+            '<sticky id="s1" x="1" y="2">async note</sticky>'
+        )
+
+        assert len(snapshot.nodes) == 1
+        assert snapshot.nodes[0].text == "async note"
+
+        filepath = future.result(timeout=5)
+        assert filepath.exists()
+        tracker = FigmaTracker("test-board")
+        loaded = tracker.load_snapshot(snapshot.timestamp)
+        assert loaded is not None
+        assert loaded.nodes == snapshot.nodes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
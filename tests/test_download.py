@@ -140,14 +140,16 @@ class TestFindFigmaSnapshots:
     def test_sorted_newest_first(self, mock_config, temp_figma_dir):
         """Test that results are sorted newest first."""
         import os
-        import time
-        
-        # Create files with different modification times
+
+        # Create files with explicit, distinct modification times
+        # (no sleeping on the wall clock)
+        now = datetime.now().timestamp()
         file1 = temp_figma_dir / "file1.png"
         file1.touch()
-        time.sleep(0.1)
+        os.utime(file1, (now - 60, now - 60))
         file2 = temp_figma_dir / "file2.png"
         file2.touch()
+        os.utime(file2, (now, now))
         
         results = find_figma_snapshots()
         
@@ -245,14 +247,16 @@ class TestCompareSnapshots:
     
     def test_auto_selects_most_recent(self, mock_config, temp_figma_dir):
         """Test automatic selection of most recent snapshots."""
-        import time
-        
+        import os
+
+        now = datetime.now().timestamp()
         file1 = temp_figma_dir / "2025-01-30_decision-tree.png"
         file1.write_bytes(b"x" * 1000)
-        time.sleep(0.1)
-        
+        os.utime(file1, (now - 60, now - 60))
+
         file2 = temp_figma_dir / "2025-01-31_decision-tree.png"
         file2.write_bytes(b"x" * 1000)
+        os.utime(file2, (now, now))
         
         result = compare_snapshots()
         
@@ -267,28 +271,40 @@ class TestCompareSnapshots:
         
         assert "error" in result
     
-    def test_likely_changed_significant(self, mock_config, temp_figma_dir):
-        """Test detection of significant change (>5%)."""
+    def test_likely_changed_size_differs(self, mock_config, temp_figma_dir):
+        """Test that any size difference is detected as a change."""
         file1 = temp_figma_dir / "old.png"
         file1.write_bytes(b"x" * 1000)
-        
+
         file2 = temp_figma_dir / "new.png"
-        file2.write_bytes(b"x" * 1200)  # 20% increase
-        
+        file2.write_bytes(b"x" * 1020)
+
         result = compare_snapshots(file1, file2)
-        
+
         assert result["likely_changed"] is True
-    
-    def test_likely_changed_insignificant(self, mock_config, temp_figma_dir):
-        """Test detection of insignificant change (<5%)."""
+
+    def test_likely_changed_same_size_different_content(self, mock_config, temp_figma_dir):
+        """Test that a same-size content change is detected via hashing."""
         file1 = temp_figma_dir / "old.png"
         file1.write_bytes(b"x" * 1000)
-        
+
         file2 = temp_figma_dir / "new.png"
-        file2.write_bytes(b"x" * 1020)  # 2% increase
-        
+        file2.write_bytes(b"y" * 1000)  # Same size, different bytes
+
         result = compare_snapshots(file1, file2)
-        
+
+        assert result["likely_changed"] is True
+
+    def test_not_changed_identical_content(self, mock_config, temp_figma_dir):
+        """Test that identical content is reported as unchanged."""
+        file1 = temp_figma_dir / "old.png"
+        file1.write_bytes(b"x" * 1000)
+
+        file2 = temp_figma_dir / "new.png"
+        file2.write_bytes(b"x" * 1000)
+
+        result = compare_snapshots(file1, file2)
+
         assert result["likely_changed"] is False
 
 
@@ -186,16 +186,39 @@ class TestFigmaSnapshot:
 # Node Parser Tests
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def parsers():
+    """Shared parser singletons keyed by node type.
+
+    Module-scoped so the suite reuses the compiled patterns instead of
+    re-instantiating a parser (and recompiling its regex) per test.
+    """
+    return {p.node_type: p for p in NODE_PARSERS}
+
+
 class TestNodeParsers:
     """Tests for node parser classes."""
-    
-    def test_shape_with_text_parser(self):
+
+    @pytest.mark.parametrize("tag,content,node_id", [
+        ("shape-with-text", '<shape-with-text id="s1" x="100" y="200">Content</shape-with-text>', "s1"),
+        ("connector", '<connector id="c1" x="50" y="50" connectorStart="n1" connectorEnd="n2">label</connector>', "c1"),
+        ("sticky", '<sticky id="st1" x="0" y="0" color="yellow">Note</sticky>', "st1"),
+        ("text", '<text id="t1" name="Header" x="10" y="20"/>', "t1"),
+    ])
+    def test_parses_single_node(self, parsers, tag, content, node_id):
+        """Test that each parser extracts one node with id and type set."""
+        nodes = parsers[tag].parse(content)
+
+        assert len(nodes) == 1
+        assert nodes[0].id == node_id
+        assert nodes[0].node_type == tag
+
+    def test_shape_with_text_parser(self, parsers):
         """Test parsing shape-with-text elements."""
-        parser = ShapeWithTextParser()
         content = '<shape-with-text id="s1" x="100" y="200" width="150" height="80" name="Box">Content here</shape-with-text>'
-        
-        nodes = parser.parse(content)
-        
+
+        nodes = parsers["shape-with-text"].parse(content)
+
         assert len(nodes) == 1
         assert nodes[0].id == "s1"
         assert nodes[0].node_type == "shape-with-text"
@@ -203,51 +226,47 @@ class TestNodeParsers:
         assert nodes[0].y == 200
         assert nodes[0].name == "Box"
         assert nodes[0].text == "Content here"
-    
-    def test_shape_with_text_parser_missing_attributes(self):
+
+    def test_shape_with_text_parser_missing_attributes(self, parsers):
         """Test parsing shape-with-text with missing optional attributes."""
-        parser = ShapeWithTextParser()
         content = '<shape-with-text id="s1">Just text</shape-with-text>'
-        
-        nodes = parser.parse(content)
-        
+
+        nodes = parsers["shape-with-text"].parse(content)
+
         assert len(nodes) == 1
         assert nodes[0].x == 0
         assert nodes[0].text == "Just text"
-    
-    def test_connector_parser(self):
+
+    def test_connector_parser(self, parsers):
         """Test parsing connector elements."""
-        parser = ConnectorParser()
         content = '<connector id="c1" x="50" y="50" connectorStart="n1" connectorStartCap="none" connectorEnd="n2" connectorEndCap="arrow">label</connector>'
-        
-        nodes = parser.parse(content)
-        
+
+        nodes = parsers["connector"].parse(content)
+
         assert len(nodes) == 1
         assert nodes[0].node_type == "connector"
         assert nodes[0].connector_start == "n1"
         assert nodes[0].connector_end == "n2"
         assert nodes[0].connector_end_cap == "arrow"
-    
-    def test_sticky_parser(self):
+
+    def test_sticky_parser(self, parsers):
         """Test parsing sticky note elements."""
-        parser = StickyParser()
         content = '<sticky id="st1" x="0" y="0" color="yellow" author="user@test.com" width="200" height="200">Note content</sticky>'
-        
-        nodes = parser.parse(content)
-        
+
+        nodes = parsers["sticky"].parse(content)
+
         assert len(nodes) == 1
         assert nodes[0].node_type == "sticky"
         assert nodes[0].color == "yellow"
         assert nodes[0].author == "user@test.com"
         assert nodes[0].text == "Note content"
-    
-    def test_text_parser(self):
+
+    def test_text_parser(self, parsers):
         """Test parsing text elements."""
-        parser = TextParser()
         content = '<text id="t1" name="Header Text" x="10" y="20" width="100" height="30"/>'
-        
-        nodes = parser.parse(content)
-        
+
+        nodes = parsers["text"].parse(content)
+
         assert len(nodes) == 1
         assert nodes[0].node_type == "text"
         assert nodes[0].name == "Header Text"
@@ -268,9 +287,9 @@ class TestNodeParsers:
         """Test safe_float with custom default."""
         assert NodeParser.safe_float(None, default=-1) == -1
     
-    def test_multiple_nodes_same_type(self):
+    def test_multiple_nodes_same_type(self, parsers):
         """Test parsing multiple nodes of the same type."""
-        parser = ShapeWithTextParser()
+        parser = parsers["shape-with-text"]
         content = '''
             <shape-with-text id="s1">First</shape-with-text>
             <shape-with-text id="s2">Second</shape-with-text>
@@ -660,6 +679,126 @@ class TestFigmaTracker:
         assert len(report.modified) == 1
 
 
+# =============================================================================
+# Snapshot Persistence Tests
+# =============================================================================
+
+class TestSnapshotPersistence:
+    """Tests for the on-disk snapshot format: delta chains, checkpoints,
+    compression, and index migration."""
+
+    @pytest.fixture
+    def mock_config(self, mock_board_config, temp_snapshot_dir):
+        """Create a mock config for testing."""
+        with patch('figma_tracker.tracker.config') as mock:
+            mock.DEFAULT_FIGMA_BOARD = "test-board"
+            mock.get_figma_board_config.return_value = mock_board_config
+            mock.get_figma_board_dir.return_value = temp_snapshot_dir
+            yield mock
+
+    @staticmethod
+    def _save_chain(tracker, count):
+        """Save `count` snapshots with evolving content; returns them."""
+        saved = []
+        for i in range(count):
+            # Each capture adds a node and rewrites an existing one so
+            # deltas carry additions and modifications.
+            content = "".join(
+                f'<sticky id="s{j}" x="{j}" y="{j}">note {j} rev {i if j == 0 else 0}</sticky>'
+                for j in range(i + 1)
+            )
+            snapshot = tracker.parse_figjam_response(content)
+            snapshot.timestamp = f"2025-01-01_00{i:02d}00"
+            tracker.save_snapshot(snapshot)
+            saved.append(snapshot)
+        return saved
+
+    @staticmethod
+    def _assert_round_trips(tracker, saved):
+        """Reload every timestamp and compare full node content."""
+        for snapshot in saved:
+            loaded = tracker.load_snapshot(snapshot.timestamp)
+            assert loaded is not None, snapshot.timestamp
+            original = sorted(snapshot.nodes, key=lambda n: n.id)
+            reloaded = sorted(loaded.nodes, key=lambda n: n.id)
+            assert reloaded == original, snapshot.timestamp
+
+    def test_delta_chain_round_trip(self, mock_config, temp_snapshot_dir):
+        """Every snapshot reloads identically across a checkpoint boundary."""
+        tracker = FigmaTracker("test-board")
+
+        # More saves than the checkpoint interval, so the chain contains
+        # full snapshots, deltas, and a second checkpoint.
+        saved = self._save_chain(tracker, 13)
+
+        full = sorted(p.name for p in temp_snapshot_dir.glob("*.json")
+                      if not p.name.endswith(".delta.json")
+                      and p.name not in ("index.json",))
+        deltas = sorted(p.name for p in temp_snapshot_dir.glob("*.delta.json"))
+        assert len(full) == 2  # initial checkpoint + one at the interval
+        assert len(deltas) == 11
+
+        self._assert_round_trips(tracker, saved)
+
+    def test_delta_chain_round_trip_compressed(self, mock_config, temp_snapshot_dir):
+        """The gzip variants round-trip across the same chain."""
+        mock_config.COMPRESS_SNAPSHOTS = True
+        tracker = FigmaTracker("test-board")
+
+        saved = self._save_chain(tracker, 12)
+
+        assert list(temp_snapshot_dir.glob("*.json.gz"))
+        assert list(temp_snapshot_dir.glob("*.delta.json.gz"))
+        # Nothing should have been written uncompressed.
+        assert not list(temp_snapshot_dir.glob("*.delta.json"))
+
+        self._assert_round_trips(tracker, saved)
+
+    def test_legacy_index_migration(self, mock_config, temp_snapshot_dir):
+        """A legacy inline index is readable and migrates to index.jsonl."""
+        legacy_row = {
+            "timestamp": "2024-12-31_235959",
+            "filename": "2024-12-31_235959.json",
+            "node_count": 1,
+        }
+        index_data = {
+            "board_name": "test-board",
+            "file_key": "test_file_key",
+            "node_id": "test_node_id",
+            "snapshots": [legacy_row],
+            "total_snapshots": 1,
+        }
+        with open(temp_snapshot_dir / "index.json", 'w') as f:
+            json.dump(index_data, f)
+
+        tracker = FigmaTracker("test-board")
+
+        # Legacy format is readable before any new capture happens.
+        assert [s["timestamp"] for s in tracker.list_snapshots()] == [
+            "2024-12-31_235959"
+        ]
+
+        snapshot = tracker.parse_figjam_response('<sticky id="s0">hi</sticky>')
+        snapshot.timestamp = "2025-01-01_000000"
+        tracker.save_snapshot(snapshot)
+
+        # The first capture materializes every row in index.jsonl and
+        # shrinks index.json to the aggregate header.
+        rows_file = temp_snapshot_dir / "index.jsonl"
+        assert rows_file.exists()
+        rows = [json.loads(line) for line in rows_file.read_bytes().splitlines()]
+        assert [r["timestamp"] for r in rows] == [
+            "2024-12-31_235959", "2025-01-01_000000"
+        ]
+        header = json.loads((temp_snapshot_dir / "index.json").read_bytes())
+        assert "snapshots" not in header
+        assert header["total_snapshots"] == 2
+
+        assert [s["timestamp"] for s in tracker.list_snapshots()] == [
+            "2025-01-01_000000", "2024-12-31_235959"
+        ]
+
+
 # =============================================================================
 # Utility Function Tests
 # =============================================================================
@@ -15,26 +15,73 @@ NOTE: This module is designed to be called by an AI assistant that has access to
 the Figma MCP tools. The capture functionality requires MCP tool invocation.
 """
 
+import heapq
+import io
 import json
 import logging
+import os
 import re
+import sys
+import xml.etree.ElementTree as ElementTree
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Pattern
+from typing import Optional, List, Dict, Any, Callable, Tuple, Pattern
+
+try:
+    # 3-10x faster than stdlib json and emits UTF-8 bytes directly
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import config, FigmaConfig
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Library-friendly logging: no handler or root configuration at import
+# time; the CLI entry point calls basicConfig itself.
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(buf: bytes) -> Any:
+    """Deserialize JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+@lru_cache(maxsize=16)
+def _read_snapshot_json(path_str: str, mtime_ns: int, compressed: bool) -> Any:
+    """Read and parse a snapshot file, memoized on (path, mtime).
+
+    Repeated compares and delta-chain walks hit the same files; the
+    mtime in the key means a rewritten file misses automatically. Only
+    the parsed dict is cached — callers build fresh node objects from
+    it, so cached data is never mutated.
+    """
+    buf = Path(path_str).read_bytes()
+    if compressed:
+        import gzip
+        buf = gzip.decompress(buf)
+    return _loads(buf)
+
+
+@dataclass(slots=True)
 class FigmaNode:
     """Represents a node in a Figma/FigJam board."""
     id: str
@@ -52,16 +99,77 @@ class FigmaNode:
     connector_end: str = ""
     connector_start_cap: str = ""
     connector_end_cap: str = ""
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary, excluding empty fields."""
-        return {k: v for k, v in asdict(self).items() if v}
+    # Fingerprint of the fields the diff inspects; one C-level tuple
+    # compare short-circuits the per-field checks for unchanged nodes.
+    _fp: tuple = field(init=False, repr=False, compare=False, default=())
+
+    def __post_init__(self):
+        # Boards repeat the same handful of types/colors/authors across
+        # thousands of nodes; interning shares one str object per value
+        # and lets equality checks win on the identity fast path. Ids
+        # recur across every snapshot of a board, so interning them lets
+        # the diff's set operations reuse the cached hash of one object.
+        self.id = sys.intern(self.id)
+        self.node_type = sys.intern(self.node_type)
+        if self.color:
+            self.color = sys.intern(self.color)
+        if self.author:
+            self.author = sys.intern(self.author)
+        self._fp = (self.text, self.name, self.x, self.y,
+                    self.connector_start, self.connector_end)
+
+    def to_dict(self, include_position: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary, excluding empty and internal fields.
+
+        With include_position=False the x/y/width/height fields are
+        dropped entirely; the dataclass defaults restore them as 0 on
+        load, so no migration is needed.
+        """
+        # All fields are scalars, so a getattr loop over the cached
+        # field names replaces asdict's recursive deepcopy machinery.
+        names = _NODE_FIELD_NAMES if include_position else _NODE_FIELD_NAMES_NO_POSITION
+        out = {}
+        for k in names:
+            v = getattr(self, k)
+            if v:
+                out[k] = v
+        return out
+
+
+# Public field names, resolved once; underscore-prefixed internals like
+# the _fp fingerprint never reach serialized output.
+_NODE_FIELD_NAMES = tuple(
+    f.name for f in fields(FigmaNode) if not f.name.startswith('_')
+)
+_NODE_FIELD_NAMES_NO_POSITION = tuple(
+    name for name in _NODE_FIELD_NAMES
+    if name not in ('x', 'y', 'width', 'height')
+)
 
 
 # =============================================================================
 # Node Parsers - Extract Method pattern to reduce duplication
 # =============================================================================
 
+def _to_float(value: Optional[str]) -> float:
+    """
+    Lean float conversion for the per-node hot path.
+
+    Attribute values arrive straight from the regex scanner as None
+    (attribute absent) or a quoted string, so a truthiness check plus a
+    bare float() covers the real cases; the except clause only fires on
+    genuinely malformed input. Unlike NodeParser.safe_float this is a
+    module-level function — no per-call attribute lookup through the
+    parser instance — with no default parameter to bind.
+    """
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
 class NodeParser(ABC):
     """Abstract base class for parsing specific node types from FigJam XML."""
     
@@ -81,7 +189,12 @@ class NodeParser(ABC):
     def create_node(self, match: re.Match) -> FigmaNode:
         """Create a FigmaNode from a regex match."""
         pass
-    
+
+    @abstractmethod
+    def build_node(self, attrs: Dict[str, str], body: str) -> FigmaNode:
+        """Create a FigmaNode from an attribute dict and element body."""
+        pass
+
     def parse(self, content: str) -> List[FigmaNode]:
         """Parse all nodes of this type from the content."""
         nodes = []
@@ -134,6 +247,18 @@ class ShapeWithTextParser(NodeParser):
             text=match.group(7).strip()
         )
 
+    def build_node(self, attrs: Dict[str, str], body: str) -> FigmaNode:
+        return FigmaNode(
+            id=attrs.get("id", ""),
+            node_type=self.node_type,
+            x=_to_float(attrs.get("x")),
+            y=_to_float(attrs.get("y")),
+            width=_to_float(attrs.get("width")),
+            height=_to_float(attrs.get("height")),
+            name=attrs.get("name", ""),
+            text=body.strip()
+        )
+
 
 class ConnectorParser(NodeParser):
     """Parser for connector elements."""
@@ -171,6 +296,19 @@ class ConnectorParser(NodeParser):
             text=match.group(8).strip()
         )
 
+    def build_node(self, attrs: Dict[str, str], body: str) -> FigmaNode:
+        return FigmaNode(
+            id=attrs.get("id", ""),
+            node_type=self.node_type,
+            x=_to_float(attrs.get("x")),
+            y=_to_float(attrs.get("y")),
+            connector_start=attrs.get("connectorStart", ""),
+            connector_start_cap=attrs.get("connectorStartCap", ""),
+            connector_end=attrs.get("connectorEnd", ""),
+            connector_end_cap=attrs.get("connectorEndCap", ""),
+            text=body.strip()
+        )
+
 
 class StickyParser(NodeParser):
     """Parser for sticky note elements."""
@@ -208,6 +346,19 @@ class StickyParser(NodeParser):
             text=match.group(8).strip()
         )
 
+    def build_node(self, attrs: Dict[str, str], body: str) -> FigmaNode:
+        return FigmaNode(
+            id=attrs.get("id", ""),
+            node_type=self.node_type,
+            x=_to_float(attrs.get("x")),
+            y=_to_float(attrs.get("y")),
+            color=attrs.get("color", ""),
+            author=attrs.get("author", ""),
+            width=_to_float(attrs.get("width")),
+            height=_to_float(attrs.get("height")),
+            text=body.strip()
+        )
+
 
 class TextParser(NodeParser):
     """Parser for text elements."""
@@ -244,6 +395,19 @@ class TextParser(NodeParser):
             text=name  # Use name as text for text elements
         )
 
+    def build_node(self, attrs: Dict[str, str], body: str) -> FigmaNode:
+        name = attrs.get("name", "")
+        return FigmaNode(
+            id=attrs.get("id", ""),
+            node_type=self.node_type,
+            name=name,
+            x=_to_float(attrs.get("x")),
+            y=_to_float(attrs.get("y")),
+            width=_to_float(attrs.get("width")),
+            height=_to_float(attrs.get("height")),
+            text=name  # Use name as text for text elements
+        )
+
 
 # Registry of all node parsers
 NODE_PARSERS: List[NodeParser] = [
@@ -253,8 +417,150 @@ NODE_PARSERS: List[NodeParser] = [
     TextParser(),
 ]
 
+# Single-pass scanner: one alternation over all node tags so the
+# document is walked once instead of once per parser. Attributes are
+# extracted from the captured attribute blob only, by a second small
+# regex, which also makes parsing tolerant of attribute order.
+_PARSERS_BY_TAG: Dict[str, NodeParser] = {p.node_type: p for p in NODE_PARSERS}
+# Bound build_node methods for the hot loops: a dict hit plus a direct
+# call, with no per-node attribute lookup on the parser instance.
+_BUILDERS_BY_TAG: Dict[str, Callable[[Dict[str, str], str], FigmaNode]] = {
+    p.node_type: p.build_node for p in NODE_PARSERS
+}
+def _detect_common_changes(
+    old_node: "FigmaNode",
+    new_node: "FigmaNode",
+    ignore_positions: bool,
+) -> List[str]:
+    """Change detector for node types with no extra attributes."""
+    changes = []
+    if old_node.text != new_node.text:
+        changes.append("text changed")
+    if old_node.name != new_node.name:
+        changes.append(f"name: '{old_node.name}' -> '{new_node.name}'")
+    if not ignore_positions:
+        if old_node.x != new_node.x or old_node.y != new_node.y:
+            changes.append(
+                f"moved from ({old_node.x}, {old_node.y}) to ({new_node.x}, {new_node.y})"
+            )
+    return changes
 
-@dataclass
+
+def _detect_connector_changes(
+    old_node: "FigmaNode",
+    new_node: "FigmaNode",
+    ignore_positions: bool,
+) -> List[str]:
+    """Change detector for connectors, which also carry endpoints."""
+    changes = []
+    if old_node.text != new_node.text:
+        changes.append("text changed")
+    if old_node.name != new_node.name:
+        changes.append(f"name: '{old_node.name}' -> '{new_node.name}'")
+    if old_node.connector_start != new_node.connector_start:
+        changes.append(
+            f"start: {old_node.connector_start} -> {new_node.connector_start}"
+        )
+    if old_node.connector_end != new_node.connector_end:
+        changes.append(f"end: {old_node.connector_end} -> {new_node.connector_end}")
+    if not ignore_positions:
+        if old_node.x != new_node.x or old_node.y != new_node.y:
+            changes.append(
+                f"moved from ({old_node.x}, {old_node.y}) to ({new_node.x}, {new_node.y})"
+            )
+    return changes
+
+
+# One specialized comparator per node type, built once at import: the
+# hot comparison loop dispatches straight to the right function instead
+# of re-testing node_type inside a generic comparator on every call.
+_CHANGE_DETECTORS: Dict[str, Callable[["FigmaNode", "FigmaNode", bool], List[str]]] = {
+    p.node_type: (
+        _detect_connector_changes
+        if p.node_type == "connector"
+        else _detect_common_changes
+    )
+    for p in NODE_PARSERS
+}
+
+_NODE_RE = re.compile(
+    r'<(shape-with-text|connector|sticky|text)\b([^>]*?)(?:/>|>([^<]*)</\1>|>)',
+    re.DOTALL
+)
+_ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+_SECTION_RE: Pattern = re.compile(r'<section\s+id="([^"]+)"\s+name="([^"]+)"')
+
+# Responses at least this large are parsed across worker processes;
+# below it, pool startup costs more than the parse itself.
+_PARALLEL_PARSE_MIN_BYTES = 1 << 20
+
+# Positions where a chunk may safely begin: the start of an opening tag
+# for a node type we parse. Cutting anywhere else (e.g. at a closing
+# tag's '<') can sever a node's body from its terminator, making
+# _NODE_RE's bare-'>' alternative drop the text.
+_SPLIT_POINT_RE = re.compile(r'<(?:shape-with-text|connector|sticky|text)\b')
+
+
+def _parse_content_chunk(chunk: str) -> List[FigmaNode]:
+    """Scan one content chunk with the regex scanner.
+
+    Module-level (not a method) so ProcessPoolExecutor can pickle it
+    for the parallel parse path; also the body of the serial fallback.
+    """
+    # Cheap C-level tag count lets the list be allocated once instead
+    # of growing through O(log N) reallocations during the scan.
+    count = sum(chunk.count(f'<{tag}') for tag in _BUILDERS_BY_TAG)
+    nodes = [None] * count
+    idx = 0
+    for match in _NODE_RE.finditer(chunk):
+        build = _BUILDERS_BY_TAG[match.group(1)]
+        attrs = dict(_ATTR_RE.findall(match.group(2)))
+        nodes[idx] = build(attrs, match.group(3) or "")
+        idx += 1
+    # Malformed tags can make the count an overestimate
+    del nodes[idx:]
+    return nodes
+
+
+def _split_content(content: str, parts: int) -> List[str]:
+    """Split content into roughly equal chunks at node boundaries.
+
+    Each cut is placed where an opening tag of a parsed node type
+    starts, so no chunk ever begins in the middle of a node's
+    attributes or between its body and closing tag; each chunk then
+    parses independently with no loss at the seams.
+    """
+    if parts <= 1:
+        return [content]
+    cuts = [0]
+    step = len(content) // parts
+    for k in range(1, parts):
+        match = _SPLIT_POINT_RE.search(content, k * step)
+        if match and match.start() > cuts[-1]:
+            cuts.append(match.start())
+    cuts.append(len(content))
+    return [content[cuts[i]:cuts[i + 1]] for i in range(len(cuts) - 1)]
+
+# Parsed index files keyed by path, tagged with the mtime they were
+# read at; stale entries are detected by a single stat.
+_INDEX_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+# Newest-first sorted views of the snapshot lists above, keyed by index
+# path and tagged with the list they were sorted from (identity check);
+# explicitly invalidated whenever _update_index appends.
+_SORTED_VIEW_CACHE: Dict[Path, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+
+# Write a full snapshot every Nth capture; the ones in between are
+# stored as deltas against their predecessor, which bounds both disk
+# growth and the reconstruction chain walked on load.
+_DELTA_CHECKPOINT_INTERVAL = 10
+
+# Full snapshots at or above this node count are written node by node
+# instead of materializing the whole serialized document in memory.
+_STREAMING_NODE_THRESHOLD = 5000
+
+
+@dataclass(slots=True)
 class FigmaSnapshot:
     """Represents a complete snapshot of a Figma board."""
     board_name: str
@@ -265,8 +571,51 @@ class FigmaSnapshot:
     section_id: str = ""
     nodes: List[FigmaNode] = field(default_factory=list)
     raw_content: str = ""
-    
-    def to_dict(self) -> Dict[str, Any]:
+    # Digest of the raw response, set at parse time; equal hashes let
+    # compare_snapshots skip the node diff entirely.
+    content_hash: str = ""
+    # Lazily built id -> node map; see node_index().
+    _node_index: Optional[Dict[str, FigmaNode]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Lazily built node_type -> count histogram; see type_counts().
+    _type_counts: Optional[Dict[str, int]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def node_index(self) -> Dict[str, FigmaNode]:
+        """
+        Map node id -> node for O(1) lookups during diffing.
+
+        Built on first access and cached, so comparing the same loaded
+        snapshot against several others rebuilds nothing. Nodes are
+        never mutated after construction, which keeps the cache valid.
+        """
+        index = self._node_index
+        if index is None:
+            index = {node.id: node for node in self.nodes}
+            self._node_index = index
+        return index
+
+    def type_counts(self) -> Dict[str, int]:
+        """
+        Histogram of node types, built once and cached.
+
+        Same contract as node_index(): nodes are immutable after
+        construction, so repeated summary calls on a held snapshot
+        reuse the first tally.
+        """
+        counts = self._type_counts
+        if counts is None:
+            counts = dict(Counter(node.node_type for node in self.nodes))
+            self._type_counts = counts
+        return counts
+
+    def to_dict(
+        self,
+        include_position: bool = True,
+        include_raw: bool = True
+    ) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "board_name": self.board_name,
@@ -276,8 +625,9 @@ class FigmaSnapshot:
             "section_name": self.section_name,
             "section_id": self.section_id,
             "node_count": len(self.nodes),
-            "nodes": [n.to_dict() for n in self.nodes],
-            "raw_content": self.raw_content
+            "nodes": [n.to_dict(include_position) for n in self.nodes],
+            "raw_content": self.raw_content if include_raw else "",
+            "content_hash": self.content_hash
         }
     
     @classmethod
@@ -292,11 +642,12 @@ class FigmaSnapshot:
             section_name=data.get("section_name", ""),
             section_id=data.get("section_id", ""),
             nodes=nodes,
-            raw_content=data.get("raw_content", "")
+            raw_content=data.get("raw_content", ""),
+            content_hash=data.get("content_hash", "")
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeChange:
     """Represents a change to a node between snapshots."""
     change_type: str  # 'added', 'removed', 'modified'
@@ -307,15 +658,30 @@ class NodeChange:
     new_text: str = ""
     details: str = ""
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization.
+
+        A literal dict instead of dataclasses.asdict, which re-runs
+        field reflection for every change in a large report.
+        """
+        return {
+            "change_type": self.change_type,
+            "node_id": self.node_id,
+            "node_type": self.node_type,
+            "name": self.name,
+            "old_text": self.old_text,
+            "new_text": self.new_text,
+            "details": self.details,
+        }
+
     def __str__(self) -> str:
-        if self.change_type == "added":
-            preview = self.new_text[:50] + "..." if len(self.new_text) > 50 else self.new_text
-            return f"  + {self.node_id} [{self.node_type}] \"{preview}\""
-        elif self.change_type == "removed":
-            preview = self.old_text[:50] + "..." if len(self.old_text) > 50 else self.old_text
-            return f"  - {self.node_id} [{self.node_type}] \"{preview}\""
-        else:  # modified
+        if self.change_type == "modified":
             return f"  ~ {self.node_id} [{self.node_type}]\n    {self.details}"
+        if self.change_type == "added":
+            sign, text = "+", self.new_text
+        else:  # removed
+            sign, text = "-", self.old_text
+        return f"  {sign} {self.node_id} [{self.node_type}] \"{_truncate_text(text, 50)}\""
 
 
 @dataclass
@@ -345,9 +711,9 @@ class ChangeReport:
                 "total_changes": len(self.added) + len(self.removed) + len(self.modified)
             },
             "changes": {
-                "added": [asdict(c) for c in self.added],
-                "removed": [asdict(c) for c in self.removed],
-                "modified": [asdict(c) for c in self.modified]
+                "added": [c.to_dict() for c in self.added],
+                "removed": [c.to_dict() for c in self.removed],
+                "modified": [c.to_dict() for c in self.modified]
             }
         }
     
@@ -362,30 +728,21 @@ class ChangeReport:
             ""
         ]
         
-        lines.append(f"ADDED NODES ({len(self.added)}):")
-        if self.added:
-            for change in self.added:
-                lines.append(str(change))
-        else:
-            lines.append("  (none)")
-        lines.append("")
-        
-        lines.append(f"MODIFIED NODES ({len(self.modified)}):")
-        if self.modified:
-            for change in self.modified:
-                lines.append(str(change))
-        else:
-            lines.append("  (none)")
-        lines.append("")
-        
-        lines.append(f"REMOVED NODES ({len(self.removed)}):")
-        if self.removed:
-            for change in self.removed:
-                lines.append(str(change))
-        else:
-            lines.append("  (none)")
-        lines.append("")
-        
+        # One growing list joined once at the end: O(total length), no
+        # quadratic string concatenation even for huge reports.
+        for label, changes in (
+            ("ADDED", self.added),
+            ("MODIFIED", self.modified),
+            ("REMOVED", self.removed),
+        ):
+            lines.append(f"{label} NODES ({len(changes)}):")
+            if changes:
+                lines.extend(map(str, changes))
+            else:
+                lines.append("  (none)")
+            lines.append("")
+
+
         lines.append("-" * 60)
         lines.append(f"Summary: {len(self.added)} added, {len(self.modified)} modified, {len(self.removed)} removed")
         lines.append("=" * 60)
@@ -418,7 +775,12 @@ class FigmaTracker:
             raise ValueError(f"Unknown board: {self.board_name}")
         
         self.snapshot_dir = config.get_figma_board_dir(self.board_name)
+        # Aggregate header; snapshot rows append to index.jsonl.
         self.index_file = self.snapshot_dir / "index.json"
+        self.index_rows_file = self.snapshot_dir / "index.jsonl"
+        # Memoized ChangeReports keyed by the resolved comparison
+        # arguments; cleared whenever a new snapshot is saved.
+        self._compare_cache: Dict[Tuple[str, str, bool], ChangeReport] = {}
     
     def parse_figjam_response(self, response_text: str) -> FigmaSnapshot:
         """
@@ -439,7 +801,14 @@ class FigmaTracker:
             timestamp=timestamp,
             raw_content=response_text
         )
-        
+
+        # One streaming hash of the response lets later compares bail
+        # out before diffing when the board did not change at all.
+        import hashlib
+        snapshot.content_hash = hashlib.blake2b(
+            response_text.encode('utf-8'), digest_size=16
+        ).hexdigest()
+
         # Extract section info
         self._parse_section_info(response_text, snapshot)
         
@@ -451,19 +820,63 @@ class FigmaTracker:
     
     def _parse_section_info(self, content: str, snapshot: FigmaSnapshot) -> None:
         """Extract section information from the response."""
-        section_match = re.search(
-            r'<section\s+id="([^"]+)"\s+name="([^"]+)"',
-            content
-        )
+        section_match = _SECTION_RE.search(content)
         if section_match:
             snapshot.section_id = section_match.group(1)
             snapshot.section_name = section_match.group(2)
     
     def _parse_all_nodes(self, content: str) -> List[FigmaNode]:
-        """Parse all nodes from content using registered parsers."""
-        nodes = []
-        for parser in NODE_PARSERS:
-            nodes.extend(parser.parse(content))
+        """
+        Parse all nodes from content.
+
+        Well-formed responses go through the expat-backed ElementTree
+        parser (C-level tokenizing, much faster on large documents, and
+        it streams so memory stays bounded at any size); anything expat
+        rejects falls back to the regex scanner, which tolerates the
+        XML-ish quirks of raw MCP output — chunked across worker
+        processes when the malformed input is large enough to pay for
+        the pool.
+        """
+        try:
+            nodes = []
+            # Responses are fragments, so give them a synthetic root.
+            # iterparse streams end events instead of building the whole
+            # tree up front; clearing each element as it is consumed
+            # keeps memory bounded on megabyte-sized boards.
+            source = io.StringIO(f"<figjam-root>{content}</figjam-root>")
+            for _, elem in ElementTree.iterparse(source):
+                build = _BUILDERS_BY_TAG.get(elem.tag)
+                if build is not None:
+                    nodes.append(build(elem.attrib, elem.text or ""))
+                elem.clear()
+            return nodes
+        except ElementTree.ParseError:
+            if len(content) >= _PARALLEL_PARSE_MIN_BYTES:
+                return self._parse_all_nodes_parallel(content)
+            return self._parse_all_nodes_regex(content)
+
+    def _parse_all_nodes_regex(self, content: str) -> List[FigmaNode]:
+        """Parse all nodes from content in a single regex scan."""
+        return _parse_content_chunk(content)
+
+    def _parse_all_nodes_parallel(self, content: str) -> List[FigmaNode]:
+        """
+        Parse a huge response across worker processes.
+
+        The scan is CPU-bound and each chunk is independent, so this
+        side-steps the GIL; chunk order is preserved when merging.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = os.cpu_count() or 1
+        chunks = _split_content(content, workers)
+        if len(chunks) == 1:
+            return _parse_content_chunk(content)
+
+        nodes: List[FigmaNode] = []
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            for part in pool.map(_parse_content_chunk, chunks):
+                nodes.extend(part)
         return nodes
     
     def save_snapshot(self, snapshot: FigmaSnapshot) -> Path:
@@ -478,45 +891,263 @@ class FigmaTracker:
         """
         # Ensure directory exists
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save snapshot JSON
-        filename = f"{snapshot.timestamp}.json"
+
+        # Most captures change a handful of nodes; store those as deltas
+        # against the previous snapshot and write a full checkpoint
+        # every _DELTA_CHECKPOINT_INTERVAL captures so loads never walk
+        # an unbounded chain.
+        # Boards that never report position changes can skip persisting
+        # x/y/width/height entirely (the dataclass defaults them to 0).
+        include_position = config.TRACK_POSITIONS is not False
+
+        previous = self.load_snapshot()
+        if (previous is not None
+                and self._deltas_since_checkpoint() + 1 < _DELTA_CHECKPOINT_INTERVAL):
+            filename = f"{snapshot.timestamp}.delta.json"
+            payload = self._snapshot_delta(previous, snapshot, include_position)
+        else:
+            filename = f"{snapshot.timestamp}.json"
+            payload = None  # full snapshot; may be streamed below
+
+        compress = config.COMPRESS_SNAPSHOTS is True
+        if compress:
+            filename += ".gz"
         filepath = self.snapshot_dir / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(snapshot.to_dict(), f, indent=2, ensure_ascii=False)
-        
+
+        # Write to a same-directory temp file and rename into place:
+        # os.replace is atomic, so a concurrent load_snapshot (or the
+        # background writer racing a reader) never sees a partial file.
+        tmppath = filepath.with_name(filepath.name + ".tmp")
+        if payload is None and len(snapshot.nodes) >= _STREAMING_NODE_THRESHOLD:
+            # Big board: write node by node so peak memory is one node's
+            # JSON, not the whole document alongside the snapshot.
+            self._write_snapshot_streaming(tmppath, snapshot, compress, include_position)
+        else:
+            body = _dumps(
+                payload if payload is not None
+                else snapshot.to_dict(include_position, include_raw=False)
+            )
+            if compress:
+                import gzip
+                # Level 1 keeps compression far faster than the disk
+                # write it saves; this JSON compresses well at any level.
+                body = gzip.compress(body, compresslevel=1)
+            tmppath.write_bytes(body)
+        os.replace(tmppath, filepath)
+
+        # The raw response goes to a sidecar so the snapshot JSON that
+        # compare/load walks stays lean; load_raw fetches it on demand.
+        if snapshot.raw_content:
+            self._write_raw_sidecar(snapshot, compress)
+
         logger.info(f"Saved snapshot to {filepath}")
-        
+
         # Update index
-        self._update_index(snapshot)
-        
+        self._update_index(snapshot, filename)
+        # A new snapshot changes what default comparisons resolve to.
+        self._compare_cache.clear()
+
         return filepath
-    
-    def _update_index(self, snapshot: FigmaSnapshot) -> None:
-        """Update the index file with the new snapshot."""
+
+    @staticmethod
+    def _write_snapshot_streaming(
+        filepath: Path,
+        snapshot: FigmaSnapshot,
+        compress: bool,
+        include_position: bool = True
+    ) -> None:
+        """Serialize a full snapshot incrementally into the file."""
+        meta = {
+            "board_name": snapshot.board_name,
+            "file_key": snapshot.file_key,
+            "node_id": snapshot.node_id,
+            "timestamp": snapshot.timestamp,
+            "section_name": snapshot.section_name,
+            "section_id": snapshot.section_id,
+            "node_count": len(snapshot.nodes),
+            "raw_content": "",
+            "content_hash": snapshot.content_hash,
+        }
+        if compress:
+            import gzip
+            f = gzip.open(filepath, 'wb', compresslevel=1)
+        else:
+            f = open(filepath, 'wb')
+        with f:
+            # Metadata object with its closing brace replaced by the
+            # node array; loads see ordinary snapshot JSON.
+            f.write(_dumps_compact(meta)[:-1])
+            f.write(b',"nodes":[')
+            for i, node in enumerate(snapshot.nodes):
+                if i:
+                    f.write(b',')
+                f.write(_dumps_compact(node.to_dict(include_position)))
+            f.write(b']}')
+
+    def _write_raw_sidecar(self, snapshot: FigmaSnapshot, compress: bool) -> None:
+        """Write the raw response text next to the snapshot file."""
+        raw_name = f"{snapshot.timestamp}.raw.txt"
+        body = snapshot.raw_content.encode('utf-8')
+        if compress:
+            import gzip
+            raw_name += ".gz"
+            body = gzip.compress(body, compresslevel=1)
+        (self.snapshot_dir / raw_name).write_bytes(body)
+
+    def load_raw(self, timestamp: str) -> Optional[str]:
+        """
+        Load the raw response text captured alongside a snapshot.
+
+        Args:
+            timestamp: Timestamp of the snapshot.
+
+        Returns:
+            The raw content string, or None if no sidecar exists.
+        """
+        for suffix in (".raw.txt", ".raw.txt.gz"):
+            filepath = self.snapshot_dir / f"{timestamp}{suffix}"
+            if not filepath.exists():
+                continue
+            buf = filepath.read_bytes()
+            if suffix.endswith(".gz"):
+                import gzip
+                buf = gzip.decompress(buf)
+            return buf.decode('utf-8')
+        return None
+
+    def _deltas_since_checkpoint(self) -> int:
+        """Count consecutive delta records since the last full snapshot."""
+        count = 0
+        for entry in reversed(self._load_index()["snapshots"]):
+            if not entry["filename"].endswith((".delta.json", ".delta.json.gz")):
+                break
+            count += 1
+        return count
+
+    @staticmethod
+    def _snapshot_delta(
+        base: FigmaSnapshot,
+        snapshot: FigmaSnapshot,
+        include_position: bool = True
+    ) -> Dict[str, Any]:
+        """Build a delta record describing snapshot relative to base."""
+        old_nodes = base.node_index()
+        new_nodes = snapshot.node_index()
+
+        def changed(node_id: str) -> bool:
+            old, new = old_nodes[node_id], new_nodes[node_id]
+            if include_position:
+                return old != new
+            # Positions are not persisted, so a position-only difference
+            # must not count as a modification (the stored base has the
+            # default 0s and would flag every node on every capture).
+            return old.to_dict(False) != new.to_dict(False)
+
+        return {
+            "format": "delta",
+            "base_timestamp": base.timestamp,
+            "board_name": snapshot.board_name,
+            "file_key": snapshot.file_key,
+            "node_id": snapshot.node_id,
+            "timestamp": snapshot.timestamp,
+            "section_name": snapshot.section_name,
+            "section_id": snapshot.section_id,
+            "node_count": len(snapshot.nodes),
+            "raw_content": "",
+            "content_hash": snapshot.content_hash,
+            "added": [
+                new_nodes[i].to_dict(include_position)
+                for i in new_nodes.keys() - old_nodes.keys()
+            ],
+            "removed": sorted(old_nodes.keys() - new_nodes.keys()),
+            "modified": [
+                new_nodes[i].to_dict(include_position)
+                for i in old_nodes.keys() & new_nodes.keys()
+                if changed(i)
+            ],
+        }
+
+    def _update_index(self, snapshot: FigmaSnapshot, filename: str) -> None:
+        """
+        Record the new snapshot in the index.
+
+        Snapshot rows live in an append-only ``index.jsonl``: recording
+        a capture appends one line instead of rewriting the entire
+        (ever-growing) row list, so the write cost stays O(1) per
+        capture. Only the small aggregate header in ``index.json`` is
+        rewritten. A pre-JSONL board is migrated in full on its first
+        capture after the upgrade.
+        """
         index = self._load_index()
-        
-        index["snapshots"].append({
+        rows = index["snapshots"]
+
+        row = {
             "timestamp": snapshot.timestamp,
-            "filename": f"{snapshot.timestamp}.json",
+            "filename": filename,
             "node_count": len(snapshot.nodes),
             "section_name": snapshot.section_name,
             "created_at": datetime.now().isoformat()
-        })
-        
+        }
+        rows.append(row)
+
         index["last_updated"] = datetime.now().isoformat()
-        index["total_snapshots"] = len(index["snapshots"])
-        
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2)
-    
+        index["total_snapshots"] = len(rows)
+
+        if self.index_rows_file.exists():
+            with open(self.index_rows_file, "ab") as f:
+                f.write(_dumps_compact(row) + b"\n")
+        else:
+            # First write (or legacy index.json with inline rows):
+            # materialize the whole row file once.
+            with open(self.index_rows_file, "wb") as f:
+                f.writelines(_dumps_compact(r) + b"\n" for r in rows)
+
+        meta = {k: v for k, v in index.items() if k != "snapshots"}
+        self.index_file.write_bytes(_dumps(meta))
+
+        # Refresh the cache in place: the just-written data is current,
+        # so the next _load_index skips both the read and the parse.
+        _INDEX_CACHE[self.index_file] = (
+            self.index_rows_file.stat().st_mtime_ns, index
+        )
+        # The append above mutated the snapshots list in place, so the
+        # cached sorted view (if any) is stale.
+        _SORTED_VIEW_CACHE.pop(self.index_file, None)
+
     def _load_index(self) -> Dict[str, Any]:
-        """Load the index file, creating if necessary."""
+        """Load the index, creating if necessary."""
+        if self.index_rows_file.exists():
+            # Memoized on the row file's mtime_ns, which changes on
+            # every append; the header is only reread alongside it.
+            mtime_ns = self.index_rows_file.stat().st_mtime_ns
+            hit = _INDEX_CACHE.get(self.index_file)
+            if hit is not None and hit[0] == mtime_ns:
+                return hit[1]
+            if self.index_file.exists():
+                index = _loads(self.index_file.read_bytes())
+            else:
+                index = self._new_index()
+            with open(self.index_rows_file, "rb") as f:
+                index["snapshots"] = [_loads(line) for line in f if line.strip()]
+            index["total_snapshots"] = len(index["snapshots"])
+            _INDEX_CACHE[self.index_file] = (mtime_ns, index)
+            return index
+
         if self.index_file.exists():
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
+            # Legacy single-file index with inline snapshot rows.
+            mtime_ns = self.index_file.stat().st_mtime_ns
+            hit = _INDEX_CACHE.get(self.index_file)
+            if hit is not None and hit[0] == mtime_ns:
+                return hit[1]
+            index = _loads(self.index_file.read_bytes())
+            index.setdefault("snapshots", [])
+            _INDEX_CACHE[self.index_file] = (mtime_ns, index)
+            return index
+
+        return self._new_index()
+
+    def _new_index(self) -> Dict[str, Any]:
+        """Fresh in-memory index for a board with no snapshots yet."""
         return {
             "board_name": self.board_name,
             "file_key": self.board_config["file_key"],
@@ -538,21 +1169,62 @@ class FigmaTracker:
         """
         if timestamp is None:
             # Get latest snapshot
-            snapshots = self.list_snapshots()
-            if not snapshots:
+            latest = self.latest_snapshots(1)
+            if not latest:
                 return None
-            timestamp = snapshots[0]["timestamp"]
-        
-        filepath = self.snapshot_dir / f"{timestamp}.json"
+            timestamp = latest[0]
         
-        if not filepath.exists():
-            logger.warning(f"Snapshot not found: {filepath}")
+        # Sniff the on-disk variant: full or delta, plain or gzipped
+        for suffix, is_delta in (
+            (".json", False),
+            (".json.gz", False),
+            (".delta.json", True),
+            (".delta.json.gz", True),
+        ):
+            filepath = self.snapshot_dir / f"{timestamp}{suffix}"
+            if not filepath.exists():
+                continue
+            data = _read_snapshot_json(
+                str(filepath),
+                filepath.stat().st_mtime_ns,
+                suffix.endswith(".gz")
+            )
+            if is_delta:
+                return self._load_from_delta(data)
+            return FigmaSnapshot.from_dict(data)
+
+        logger.warning(f"Snapshot not found: {timestamp}")
+        return None
+
+    def _load_from_delta(self, data: Dict[str, Any]) -> Optional[FigmaSnapshot]:
+        """Reconstruct a snapshot from a delta record and its base chain."""
+        base = self.load_snapshot(data["base_timestamp"])
+        if base is None:
+            logger.warning(
+                f"Base snapshot {data['base_timestamp']} missing for "
+                f"delta {data['timestamp']}"
+            )
             return None
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return FigmaSnapshot.from_dict(data)
+
+        nodes = base.node_index()
+        for node_id in data.get("removed", []):
+            nodes.pop(node_id, None)
+        for node_dict in data.get("modified", []):
+            nodes[node_dict["id"]] = FigmaNode(**node_dict)
+        for node_dict in data.get("added", []):
+            nodes[node_dict["id"]] = FigmaNode(**node_dict)
+
+        return FigmaSnapshot(
+            board_name=data.get("board_name", ""),
+            file_key=data.get("file_key", ""),
+            node_id=data.get("node_id", ""),
+            timestamp=data.get("timestamp", ""),
+            section_name=data.get("section_name", ""),
+            section_id=data.get("section_id", ""),
+            nodes=list(nodes.values()),
+            raw_content=data.get("raw_content", ""),
+            content_hash=data.get("content_hash", "")
+        )
     
     def list_snapshots(self) -> List[Dict[str, Any]]:
         """
@@ -562,13 +1234,48 @@ class FigmaTracker:
             List of snapshot metadata, sorted by timestamp (newest first).
         """
         index = self._load_index()
-        snapshots = index.get("snapshots", [])
-        
-        # Sort by timestamp descending
-        snapshots.sort(key=lambda x: x["timestamp"], reverse=True)
-        
-        return snapshots
-    
+        snaps = index.get("snapshots", [])
+
+        # Sort once per index generation: the view is cached against the
+        # identity of the snapshots list (stable while the index stays
+        # cached) and invalidated by _update_index, so the common
+        # list/compare/summary call sequences pay the O(n log n) sort a
+        # single time. Callers get a fresh copy so the cached view and
+        # the append-ordered index list stay untouched.
+        hit = _SORTED_VIEW_CACHE.get(self.index_file)
+        if hit is not None and hit[0] is snaps:
+            return list(hit[1])
+
+        view = sorted(snaps, key=lambda x: x["timestamp"], reverse=True)
+        _SORTED_VIEW_CACHE[self.index_file] = (snaps, view)
+        return list(view)
+
+    def latest_snapshots(self, n: int = 2) -> List[str]:
+        """
+        Return the timestamps of the ``n`` most recent snapshots.
+
+        Fast path for callers that only need the top of the list (the
+        latest-load and default-compare cases): serves slices of the
+        cached sorted view when one exists, and otherwise picks the top
+        ``n`` entries with a bounded heap instead of sorting everything.
+
+        Args:
+            n: Maximum number of timestamps to return.
+
+        Returns:
+            Up to ``n`` timestamps, newest first.
+        """
+        index = self._load_index()
+        snaps = index.get("snapshots", [])
+
+        hit = _SORTED_VIEW_CACHE.get(self.index_file)
+        if hit is not None and hit[0] is snaps:
+            return [entry["timestamp"] for entry in hit[1][:n]]
+
+        top = heapq.nlargest(n, snaps, key=lambda entry: entry["timestamp"])
+        return [entry["timestamp"] for entry in top]
+
+
     def compare_snapshots(
         self,
         from_timestamp: str = None,
@@ -593,7 +1300,16 @@ class FigmaTracker:
         
         if from_timestamp is None or to_timestamp is None:
             return self._empty_change_report(from_timestamp, to_timestamp)
-        
+
+        # Snapshots on disk are immutable once written, so a report for
+        # a resolved (from, to, ignore_positions) triple can be reused
+        # verbatim; save_snapshot clears the cache. Callers treat
+        # reports as read-only.
+        cache_key = (from_timestamp, to_timestamp, ignore_positions)
+        cached = self._compare_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Load snapshots
         old_snapshot = self.load_snapshot(from_timestamp)
         new_snapshot = self.load_snapshot(to_timestamp)
@@ -601,10 +1317,20 @@ class FigmaTracker:
         if not old_snapshot or not new_snapshot:
             logger.error("Could not load snapshots for comparison")
             return self._empty_change_report(from_timestamp, to_timestamp)
-        
+
+        # Identical raw responses cannot differ at the node level;
+        # re-captures of an unchanged board skip the diff entirely.
+        if (
+            old_snapshot.content_hash
+            and old_snapshot.content_hash == new_snapshot.content_hash
+        ):
+            report = self._empty_change_report(from_timestamp, to_timestamp)
+            self._compare_cache[cache_key] = report
+            return report
+
         # Build node maps and compute differences
-        old_nodes = {n.id: n for n in old_snapshot.nodes}
-        new_nodes = {n.id: n for n in new_snapshot.nodes}
+        old_nodes = old_snapshot.node_index()
+        new_nodes = new_snapshot.node_index()
         
         report = ChangeReport(
             board_name=self.board_name,
@@ -613,10 +1339,9 @@ class FigmaTracker:
         )
         
         # Populate report with changes
-        self._find_added_nodes(old_nodes, new_nodes, report)
-        self._find_removed_nodes(old_nodes, new_nodes, report)
-        self._find_modified_nodes(old_nodes, new_nodes, report, ignore_positions)
-        
+        self._diff_nodes(old_nodes, new_nodes, report, ignore_positions)
+
+        self._compare_cache[cache_key] = report
         return report
     
     def _resolve_comparison_timestamps(
@@ -625,16 +1350,17 @@ class FigmaTracker:
         to_timestamp: Optional[str]
     ) -> Tuple[Optional[str], Optional[str]]:
         """Resolve default timestamps for comparison."""
-        snapshots = self.list_snapshots()
-        
-        if len(snapshots) < 2:
+        # Only the two newest entries matter here; skip the full listing.
+        latest = self.latest_snapshots(2)
+
+        if len(latest) < 2:
             logger.warning("Not enough snapshots to compare")
             return None, None
-        
+
         if to_timestamp is None:
-            to_timestamp = snapshots[0]["timestamp"]
+            to_timestamp = latest[0]
         if from_timestamp is None:
-            from_timestamp = snapshots[1]["timestamp"]
+            from_timestamp = latest[1]
         
         return from_timestamp, to_timestamp
     
@@ -650,58 +1376,46 @@ class FigmaTracker:
             to_snapshot=to_snapshot or "(none)"
         )
     
-    def _find_added_nodes(
-        self,
-        old_nodes: Dict[str, FigmaNode],
-        new_nodes: Dict[str, FigmaNode],
-        report: ChangeReport
-    ) -> None:
-        """Find nodes that were added in the new snapshot."""
-        added_ids = set(new_nodes.keys()) - set(old_nodes.keys())
-        for node_id in added_ids:
-            node = new_nodes[node_id]
-            report.added.append(NodeChange(
-                change_type="added",
-                node_id=node_id,
-                node_type=node.node_type,
-                name=node.name,
-                new_text=node.text
-            ))
-    
-    def _find_removed_nodes(
-        self,
-        old_nodes: Dict[str, FigmaNode],
-        new_nodes: Dict[str, FigmaNode],
-        report: ChangeReport
-    ) -> None:
-        """Find nodes that were removed from the old snapshot."""
-        removed_ids = set(old_nodes.keys()) - set(new_nodes.keys())
-        for node_id in removed_ids:
-            node = old_nodes[node_id]
-            report.removed.append(NodeChange(
-                change_type="removed",
-                node_id=node_id,
-                node_type=node.node_type,
-                name=node.name,
-                old_text=node.text
-            ))
-    
-    def _find_modified_nodes(
+    def _diff_nodes(
         self,
         old_nodes: Dict[str, FigmaNode],
         new_nodes: Dict[str, FigmaNode],
         report: ChangeReport,
         ignore_positions: bool
     ) -> None:
-        """Find nodes that were modified between snapshots."""
-        common_ids = set(old_nodes.keys()) & set(new_nodes.keys())
-        
-        for node_id in common_ids:
-            old_node = old_nodes[node_id]
-            new_node = new_nodes[node_id]
-            
-            changes = self._detect_node_changes(old_node, new_node, ignore_positions)
-            
+        """
+        Classify every node as added, removed, or modified.
+
+        Single-pass merge: one walk over the old map classifies removed
+        and modified, one walk over the new map picks up additions, so
+        each id is hashed at most twice and no intermediate key sets
+        are materialized.
+        """
+        for node_id, old_node in old_nodes.items():
+            new_node = new_nodes.get(node_id)
+            if new_node is None:
+                report.removed.append(NodeChange(
+                    change_type="removed",
+                    node_id=node_id,
+                    node_type=old_node.node_type,
+                    name=old_node.name,
+                    old_text=old_node.text
+                ))
+                continue
+
+            # Unchanged nodes are the common case; the fingerprint
+            # covers every field the detailed check would look at.
+            if old_node._fp == new_node._fp:
+                continue
+
+            # Per-type comparators skip the connector dispatch inside
+            # the loop; unknown types fall back to the generic method.
+            detect = _CHANGE_DETECTORS.get(new_node.node_type)
+            if detect is None:
+                changes = self._detect_node_changes(old_node, new_node, ignore_positions)
+            else:
+                changes = detect(old_node, new_node, ignore_positions)
+
             if changes:
                 details = self._format_change_details(old_node, new_node, changes)
                 report.modified.append(NodeChange(
@@ -713,6 +1427,16 @@ class FigmaTracker:
                     new_text=new_node.text,
                     details=details
                 ))
+
+        for node_id, new_node in new_nodes.items():
+            if node_id not in old_nodes:
+                report.added.append(NodeChange(
+                    change_type="added",
+                    node_id=node_id,
+                    node_type=new_node.node_type,
+                    name=new_node.name,
+                    new_text=new_node.text
+                ))
     
     def _detect_node_changes(
         self,
@@ -777,17 +1501,12 @@ class FigmaTracker:
         if not snapshot:
             return None
         
-        # Count node types
-        type_counts = {}
-        for node in snapshot.nodes:
-            type_counts[node.node_type] = type_counts.get(node.node_type, 0) + 1
-        
         return {
             "board_name": snapshot.board_name,
             "timestamp": snapshot.timestamp,
             "section_name": snapshot.section_name,
             "total_nodes": len(snapshot.nodes),
-            "node_types": type_counts
+            "node_types": snapshot.type_counts()
         }
 
 
@@ -837,10 +1556,33 @@ def print_boards() -> None:
     print(f"\n{'=' * 60}")
 
 
+# Rendered once at import; the no-arguments invocation does nothing but
+# print this, so emit it as a single write instead of ~10 print calls.
+_HELP_BANNER = "\n".join([
+    "",
+    "Figma Board Change Tracker",
+    "=" * 40,
+    "",
+    "Usage:",
+    "  python -m figma_tracker.tracker --capture    # Capture new snapshot",
+    "  python -m figma_tracker.tracker --compare    # Compare recent snapshots",
+    "  python -m figma_tracker.tracker --list       # List all snapshots",
+    "  python -m figma_tracker.tracker --boards     # List configured boards",
+    "  python -m figma_tracker.tracker --summary    # Show snapshot summary",
+    "",
+    "For detailed help: python -m figma_tracker.tracker --help",
+]) + "\n"
+
+
 def main():
     """Main entry point for CLI usage."""
     import argparse
-    
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     parser = argparse.ArgumentParser(
         description="Figma Board Change Tracker",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -961,31 +1703,43 @@ Note: The --capture command outputs instructions for using MCP tools.
             if args.json:
                 print(json.dumps(summary, indent=2))
             else:
-                print(f"\n{'=' * 60}")
-                print("Latest Snapshot Summary")
-                print(f"{'=' * 60}")
-                print(f"  Board: {summary['board_name']}")
-                print(f"  Timestamp: {summary['timestamp']}")
-                print(f"  Section: {summary['section_name']}")
-                print(f"  Total Nodes: {summary['total_nodes']}")
-                print(f"  Node Types:")
-                for ntype, count in summary['node_types'].items():
-                    print(f"    - {ntype}: {count}")
-                print(f"{'=' * 60}")
+                # One buffered write instead of a print per node type.
+                lines = [
+                    "",
+                    "=" * 60,
+                    "Latest Snapshot Summary",
+                    "=" * 60,
+                    f"  Board: {summary['board_name']}",
+                    f"  Timestamp: {summary['timestamp']}",
+                    f"  Section: {summary['section_name']}",
+                    f"  Total Nodes: {summary['total_nodes']}",
+                    "  Node Types:",
+                ]
+                lines.extend(
+                    f"    - {ntype}: {count}"
+                    for ntype, count in summary['node_types'].items()
+                )
+                lines.append("=" * 60)
+                sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("No snapshots found")
     
     else:
         # Default: show help
-        print("\nFigma Board Change Tracker")
-        print("=" * 40)
-        print("\nUsage:")
-        print("  python -m figma_tracker.tracker --capture    # Capture new snapshot")
-        print("  python -m figma_tracker.tracker --compare    # Compare recent snapshots")
-        print("  python -m figma_tracker.tracker --list       # List all snapshots")
-        print("  python -m figma_tracker.tracker --boards     # List configured boards")
-        print("  python -m figma_tracker.tracker --summary    # Show snapshot summary")
-        print("\nFor detailed help: python -m figma_tracker.tracker --help")
+        sys.stdout.write(_HELP_BANNER)
+
+
+@lru_cache(maxsize=8)
+def _get_tracker(board_name: Optional[str]) -> FigmaTracker:
+    """
+    Shared FigmaTracker per board for the capture helpers.
+
+    A session that captures the same board repeatedly skips the config
+    lookup and path resolution after the first call, and reusing one
+    instance lets its compare/index caches accumulate across captures.
+    Bounded at 8 boards; tests can reset via _get_tracker.cache_clear().
+    """
+    return FigmaTracker(board_name)
 
 
 # Helper function for AI assistant to capture snapshots
@@ -1011,10 +1765,64 @@ def capture_figma_snapshot(
         filepath, snapshot = capture_figma_snapshot(response_text)
         print(f"Saved {snapshot.node_count} nodes to {filepath}")
     """
-    tracker = FigmaTracker(board_name)
+    return capture_figma_snapshots([(mcp_response, board_name)])[0]
+
+
+def capture_figma_snapshot_async(
+    mcp_response: str,
+    board_name: str = None
+) -> Tuple["Future[Path]", FigmaSnapshot]:
+    """
+    Parse a snapshot now, persist it in the background.
+
+    Variant of capture_figma_snapshot for pipelines that only need the
+    FigmaSnapshot to continue (e.g. an in-memory compare or the next
+    MCP fetch): the disk write happens on the shared background writer
+    and the returned Future resolves to the saved path. The writer
+    preserves submission order and flushes at interpreter exit, so the
+    delta chain stays valid and no queued write is lost.
+
+    Args:
+        mcp_response: The text response from mcp_Figma_get_figjam tool.
+        board_name: Board name. Defaults to config default.
+
+    Returns:
+        Tuple of (future resolving to the filepath, snapshot).
+    """
+    from .async_writer import get_writer
+
+    tracker = _get_tracker(board_name)
     snapshot = tracker.parse_figjam_response(mcp_response)
-    filepath = tracker.save_snapshot(snapshot)
-    return filepath, snapshot
+    return get_writer().submit(tracker, snapshot), snapshot
+
+
+def capture_figma_snapshots(
+    responses: List[Tuple[str, Optional[str]]]
+) -> List[Tuple[Path, FigmaSnapshot]]:
+    """
+    Capture and save several Figma snapshots in one pass.
+
+    Batch variant of capture_figma_snapshot for workflows that fetch
+    multiple boards (or several sections of one board) back to back:
+    one FigmaTracker is built per distinct board and reused for every
+    response targeting it, so config lookup and path resolution are
+    paid once per board instead of once per response.
+
+    Args:
+        responses: List of (mcp_response, board_name) pairs. A board
+            name of None uses the config default.
+
+    Returns:
+        List of (filepath, snapshot) tuples, in input order.
+    """
+    results: List[Tuple[Path, FigmaSnapshot]] = []
+
+    for mcp_response, board_name in responses:
+        tracker = _get_tracker(board_name)
+        snapshot = tracker.parse_figjam_response(mcp_response)
+        results.append((tracker.save_snapshot(snapshot), snapshot))
+
+    return results
 
 
 if __name__ == "__main__":